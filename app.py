@@ -19,6 +19,7 @@ Usage:
 """
 
 import os
+import atexit
 import logging
 from datetime import datetime, timedelta
 from functools import wraps
@@ -56,6 +57,8 @@ api_client = VagonAPI(
     api_secret=os.getenv('VAGON_API_SECRET', ''),
     base_url=os.getenv('VAGON_BASE_URL', VagonAPI.PRODUCTION_URL)
 )
+# The client keeps pooled keep-alive connections open; release them on exit
+atexit.register(api_client.close)
 
 
 # =============================================================================
@@ -389,7 +392,7 @@ def index():
     )
 
     # Flatten JSON:API format for template
-    machines = flatten_jsonapi_list(result.get('machines', []))
+    machines = flatten_jsonapi_list(result.get('machines', []), inplace=True)
 
     return render_template(
         'index.html',
@@ -430,7 +433,7 @@ def machine_detail(machine_id):
     )
 
     # Flatten JSON:API format for template
-    files = flatten_jsonapi_list(files_result.get('files', []))
+    files = flatten_jsonapi_list(files_result.get('files', []), inplace=True)
     current = flatten_jsonapi_resource(files_result.get('current'))
 
     return render_template(
@@ -467,7 +470,7 @@ def organization_files():
     capacity = api_client.get_capacity()
 
     # Flatten JSON:API format for template
-    files = flatten_jsonapi_list(result.get('files', []))
+    files = flatten_jsonapi_list(result.get('files', []), inplace=True)
     current = flatten_jsonapi_resource(result.get('current'))
 
     return render_template(
@@ -540,7 +543,7 @@ def images():
 
     # Get machines for assign modal
     machines_result = api_client.list_machines(page=1, per_page=100)
-    machines = flatten_jsonapi_list(machines_result.get('machines', []))
+    machines = flatten_jsonapi_list(machines_result.get('machines', []), inplace=True)
 
     return render_template(
         'images.html',
@@ -688,7 +691,7 @@ def api_list_machines():
     )
 
     # Flatten JSON:API format for template
-    machines = flatten_jsonapi_list(result.get('machines', []))
+    machines = flatten_jsonapi_list(result.get('machines', []), inplace=True)
 
     return jsonify({
         'machines': machines,
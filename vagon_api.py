@@ -20,59 +20,180 @@ Usage:
     client.start_machine(machine_id=123)
 """
 
+import asyncio
 import hmac
 import hashlib
 import uuid
 import time
 import json
 import logging
-from typing import Optional, Dict, List, Any
+import random
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import urlencode
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union, Dict, List, Any, Callable, Iterable, Iterator, AsyncIterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Configure logging for vagon_api
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the standard library
+    orjson = None
 
 # Configure logging for vagon_api
 logger = logging.getLogger(__name__)
 
+# Response bodies larger than this (in bytes) are only pretty-printed in
+# the logs at DEBUG level; INFO gets their size instead
+_LOG_BODY_LIMIT = 4096
+# Divider between logged requests/responses
+_SEP = '=' * 60
+
+
+# JSON encoding helpers. Both backends produce the same compact UTF-8
+# bytes, so request bodies (and their signatures) do not depend on
+# whether orjson is installed.
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
+    def _pretty(obj: Any) -> str:
+        """Indented JSON for log output."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    _loads = json.loads
+
+    def _pretty(obj: Any) -> str:
+        """Indented JSON for log output."""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+@lru_cache(maxsize=256)
+def _archive_logs_query(start_date: str, end_date: str, expires_in: int) -> str:
+    """Encoded query string for the archived logs endpoint, reused when a
+    dashboard polls the same date range."""
+    return urlencode({"start_date": start_date, "end_date": end_date, "expires_in": expires_in})
+
 
 class VagonAPIError(Exception):
     """Custom exception for Vagon API errors."""
 
     def __init__(self, status_code: int, message: str, client_code: int = None):
+        # The raw arguments become self.args, so the error pickles and
+        # the message string is only built when the error is rendered
+        super().__init__(status_code, message, client_code)
         self.status_code = status_code
         self.message = message
         self.client_code = client_code or status_code
-        super().__init__(f"[{self.client_code}] {message}")
 
+    def __str__(self) -> str:
+        return f"[{self.client_code}] {self.message}"
 
-class VagonAPI:
+
+class _RateLimiter:
     """
-    Python client for Vagon Computer Management API.
+    Token bucket limiting requests to `rate` per second.
 
-    This client handles HMAC authentication and provides methods for all
-        available API endpoints including machines and files management.
+    Tokens are refilled lazily on each reservation, so no background
+    thread is needed. Shared by all threads (and tasks) using a client.
+    """
 
-    Attributes:
-        api_key: Your Vagon API key
-        api_secret: Your Vagon API secret
-        base_url: API base URL (default: production)
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
 
-    Example:
-        >>> client = VagonAPI("api_key", "api_secret")
-        >>> machines = client.list_machines()
-        >>> print(f"Found {machines['count']} machines")
+    def reserve(self) -> float:
+        """
+        Take a token.
+
+        The bucket may go into debt, which queues callers in arrival order.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class _VagonAPIBase:
+    """
+    Transport-independent core shared by VagonAPI and AsyncVagonAPI.
+
+    Holds request signing, request preparation, response parsing, the
+    response cache and every endpoint method. Endpoints only build
+    requests: they return the result of _request(), _cached_get(),
+    _parallel() or _iter_pages() unchanged, or post-process it through
+    _then(), so the same method works whether the subclass returns values
+    (VagonAPI) or awaitables (AsyncVagonAPI).
     """
 
     # API Base URLs
     PRODUCTION_URL = "https://api.vagon.io"
 
+    # Endpoint paths shared by several methods
+    MACHINES_PATH = "/organization-management/v1/machines"
+    PERMISSION_FIELDS_PATH = "/organization-management/v1/machines/permission-fields"
+    SOFTWARE_PATH = "/organization-management/v1/software"
+    IMAGES_PATH = "/organization-management/v1/images"
+    FILES_PATH = "/organization-management/v1/files"
+    USER_ACTION_LOGS_PATH = "/organization-management/v1/user-action-logs"
+    ARCHIVED_LOGS_PATH = "/organization-management/v1/user-action-logs/archived-download-urls"
+
+    # Status codes that are retried with a freshly signed request
+    RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+    # Methods that are safe to retry after a gateway error (5xx). 429 means
+    # the request was rejected before processing, so it is retried for all.
+    IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
+    # Longest Retry-After (seconds) waited out before retrying. A server
+    # asking for more fails the request instead of blocking the caller.
+    MAX_RETRY_DELAY = 60
+
+    # Response cache tiers as (fresh_for, stale_for) in seconds. Fresh
+    # responses are served directly; stale ones are served while a refresh
+    # runs in the background. Hits are parsed from the cached bytes, so
+    # every caller gets a dict of its own.
+    CACHE_SHORT = (5, 15)
+    CACHE_NORMAL = (30, 60)
+    CACHE_LONG = (60, 600)
+    # Never served without asking the API, but revalidated with the cached
+    # ETag / Last-Modified, so an unchanged resource costs a bodiless 304.
+    # For resources whose state changes often, like a machine's status.
+    # Entries without validators are not kept.
+    CACHE_REVALIDATE = (0, 0)
+    # Entries kept before the least recently used one is evicted. Every
+    # distinct (path, params) pair, e.g. each image ID or log query, is
+    # a separate entry.
+    CACHE_MAX_ENTRIES = 1024
+    # Background threads refreshing stale cache entries (sync client)
+    REFRESH_WORKERS = 4
+
     def __init__(
         self,
         api_key: str,
         api_secret: str,
-        base_url: str = PRODUCTION_URL
+        base_url: str = PRODUCTION_URL,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+        timeout: Optional[float] = 30,
+        rate_limit: Optional[float] = None
     ):
         """
         Initialize the Vagon API client.
@@ -81,10 +202,44 @@ class VagonAPI:
             api_key: Your API key from organization settings
             api_secret: Your API secret from organization settings
             base_url: API base URL (default: production)
+            max_retries: Retries for connection errors and retryable
+                status codes (default: 3)
+            backoff_factor: Base delay in seconds for exponential backoff
+                between retries (default: 0.3)
+            timeout: Request timeout in seconds, None to wait forever (default: 30)
+            rate_limit: Maximum requests per second sent by this client,
+                retries included (optional, unlimited by default)
         """
         self.api_key = api_key
         self.api_secret = api_secret
+        # Every signature is keyed with the secret and starts with the API
+        # key, so that HMAC state is computed once and copied per request
+        self._hmac_template = hmac.new(
+            api_secret.encode('utf-8'),
+            api_key.encode('ascii'),
+            hashlib.sha256
+        )
         self.base_url = base_url.rstrip('/')
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self._rate_limiter = _RateLimiter(rate_limit) if rate_limit else None
+
+        # In-memory response cache for read-only endpoints:
+        # (path, sorted params) -> (fresh_until, stale_until, body, validators)
+        # where body is the raw response bytes, parsed again on every hit,
+        # and validators are the conditional request headers built from
+        # the response's ETag / Last-Modified
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._cache_generation = 0
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+
+        self._connect()
+
+    def _connect(self) -> None:
+        """Create the HTTP transport used by _send (defined by each client)."""
+        raise NotImplementedError
 
     # =========================================================================
     # AUTHENTICATION
@@ -96,7 +251,7 @@ class VagonAPI:
         path: str,
         timestamp: str,
         nonce: str,
-        body: str = ''
+        body: bytes = b''
     ) -> str:
         """
         Generate HMAC-SHA256 signature for API authentication.
@@ -109,22 +264,23 @@ class VagonAPI:
             path: Request path (e.g., '/organization-management/v1/seats')
             timestamp: Unix timestamp in milliseconds
             nonce: Unique request identifier (UUID recommended)
-            body: Request body as string (empty for GET requests)
+            body: Serialized request body (empty for GET requests)
 
         Returns:
             Hex-encoded HMAC-SHA256 signature
         """
-        signature_string = f"{self.api_key}{method}{path}{timestamp}{nonce}{body}"
-
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            signature_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        # The message is fed in parts rather than concatenated: the API key
+        # is already in the template, the per-request fields are ASCII, and
+        # the body is already UTF-8 encoded bytes, so nothing is copied or
+        # re-encoded.
+        signature = self._hmac_template.copy()
+        signature.update(f"{method}{path}{timestamp}{nonce}".encode('ascii'))
+        if body:
+            signature.update(body)
 
-        return signature
+        return signature.hexdigest()
 
-    def _generate_auth_header(self, method: str, path: str, body: str = '') -> str:
+    def _generate_auth_header(self, method: str, path: str, body: bytes = b'') -> str:
         """
         Generate the complete Authorization header for API requests.
 
@@ -133,13 +289,15 @@ class VagonAPI:
         Args:
             method: HTTP method
             path: Request path
-            body: Request body as string
+            body: Serialized request body
 
         Returns:
             Complete Authorization header value
         """
+        # The nonce keeps the canonical dashed UUID form the API documents
         nonce = str(uuid.uuid4())
-        timestamp = str(int(time.time() * 1000))
+        # Integer nanoseconds avoid float rounding in the millisecond timestamp
+        timestamp = str(time.time_ns() // 1_000_000)
 
         signature = self._generate_hmac_signature(
             method=method,
@@ -155,84 +313,159 @@ class VagonAPI:
     # HTTP REQUEST HANDLING
     # =========================================================================
 
-    def _request(
+    def _should_retry(self, method: str, status_code: int, attempt: int) -> bool:
+        """
+        Decide whether a response should be retried.
+
+        Gateway errors are only retried for idempotent methods so that,
+        for example, create_machine() never creates machines twice.
+        """
+        if attempt >= self.max_retries or status_code not in self.RETRY_STATUS_CODES:
+            return False
+        return status_code == 429 or method in self.IDEMPOTENT_METHODS
+
+    def _retry_delay(self, response, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt.
+
+        Honors a numeric Retry-After header, otherwise uses exponential
+        backoff. Random jitter is added so that parallel callers throttled
+        at the same moment don't all retry at the same moment again.
+
+        Returns:
+            The delay, or None if Retry-After exceeds MAX_RETRY_DELAY and
+            the response should be returned (and raised) as is.
+        """
+        backoff = self.backoff_factor * (2 ** attempt)
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+            if delay > self.MAX_RETRY_DELAY:
+                logger.warning(
+                    "[VAGON API RETRY] status=%s, Retry-After=%ss exceeds %ss, not retrying",
+                    response.status_code, retry_after, self.MAX_RETRY_DELAY
+                )
+                return None
+        else:
+            delay = backoff
+        delay += random.uniform(0, backoff)
+        logger.warning(
+            "[VAGON API RETRY] status=%s, attempt=%d/%d, retrying in %.2fs",
+            response.status_code, attempt + 1, self.max_retries, delay
+        )
+        return delay
+
+    def _prepare_request(
         self,
         method: str,
         path: str,
-        params: Optional[Dict] = None,
-        body: Optional[Dict] = None
-    ) -> Dict[str, Any]:
+        params: Optional[Union[Dict, str]] = None,
+        body: Optional[Dict] = None,
+        body_bytes: bytes = b''
+    ) -> tuple:
         """
-        Make an authenticated HTTP request to the Vagon API.
+        Sign a request and log its details.
+
+        Shared by the sync and async clients so both send identical requests.
 
         Args:
-            method: HTTP method (GET, POST, DELETE)
-            path: API endpoint path
-            params: Query parameters (optional)
-            body: Request body as dict (optional)
+            body: Request body as dict, used for logging
+            body_bytes: The serialized body that is signed and sent
 
         Returns:
-            Parsed JSON response
-
-        Raises:
-            VagonAPIError: If the API returns an error response
+            Tuple of (full_url, headers)
         """
-        # Serialize body to JSON string for HMAC calculation
-        body_str = json.dumps(body) if body else ''
-
         # Generate authentication header
-        auth_header = self._generate_auth_header(method, path, body_str)
+        auth_header = self._generate_auth_header(method, path, body_bytes)
 
-        # Prepare headers
-        headers = {"Authorization": auth_header}
-        if body:
-            headers["Content-Type"] = "application/json"
+        # Prepare headers. Accept is a session/client default; only the
+        # per-request signature and, with a body, its Content-Type are added.
+        if body_bytes:
+            headers = {"Authorization": auth_header, "Content-Type": "application/json"}
+        else:
+            headers = {"Authorization": auth_header}
 
-        # Debug: Log request details
+        # Debug: Log request details. The pretty-printed body is only
+        # built when INFO records are actually emitted.
         full_url = f"{self.base_url}{path}"
-        logger.info(f"\n{'='*60}")
-        logger.info(f"[VAGON API REQUEST]")
-        logger.info(f"  Method: {method}")
-        logger.info(f"  URL: {full_url}")
-        if params:
-            logger.info(f"  Params: {params}")
-        if body:
-            logger.info(f"  Body: {json.dumps(body, indent=2)}")
-        logger.info(f"{'='*60}")
+        if logger.isEnabledFor(logging.INFO):
+            _info = logger.info
+            _info("\n%s", _SEP)
+            _info("[VAGON API REQUEST]")
+            _info("  Method: %s", method)
+            _info("  URL: %s", full_url)
+            if params:
+                _info("  Params: %s", params)
+            if body:
+                _info("  Body: %s", _pretty(body))
+            _info("%s", _SEP)
 
-        # Make the request
-        response = requests.request(
-            method=method,
-            url=full_url,
-            headers=headers,
-            params=params,
-            data=body_str if body_str else None
-        )
+        return full_url, headers
 
-        # Debug: Log response details
-        logger.info(f"\n[VAGON API RESPONSE]")
-        logger.info(f"  Status: {response.status_code}")
-        logger.info(f"  Headers: {dict(response.headers)}")
-        try:
-            response_json = response.json() if response.content else {}
-            logger.info(f"  Body: {json.dumps(response_json, indent=2)}")
-        except json.JSONDecodeError:
-            logger.warning(f"  Body (raw, not JSON): {response.text[:500]}")
-            response_json = {}
-        logger.info(f"{'='*60}\n")
+    def _handle_response(self, response) -> Dict[str, Any]:
+        """
+        Log and parse an API response, raising on error status codes.
+
+        Works with both requests and httpx response objects.
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            VagonAPIError: If the API returns an error response
+        """
+        # Debug: Log response details. Pretty-printing the body is skipped
+        # unless INFO is enabled.
+        verbose = logger.isEnabledFor(logging.INFO)
+        _info = logger.info
+        if verbose:
+            _info("\n[VAGON API RESPONSE]")
+            _info("  Status: %s", response.status_code)
+            # Headers rarely matter on success; logging renders them lazily
+            logger.debug("  Headers: %r", response.headers)
 
         # Handle errors
-        if not response.ok:
+        if response.status_code >= 400:
+            _info("%s\n", _SEP)
             error_message, client_code = self._parse_error_response(response)
-            logger.error(f"[VAGON API ERROR] client_code={client_code}, status={response.status_code}, message={error_message}")
-            logger.error(f"  Response text: {response.text[:500]}")
-            logger.error(f"  Response headers: {dict(response.headers)}")
+            _err = logger.error
+            _err("[VAGON API ERROR] client_code=%s, status=%s, message=%s", client_code, response.status_code, error_message)
+            _err("  Response text: %s", response.text[:500])
+            _err("  Response headers: %r", response.headers)
             raise VagonAPIError(response.status_code, error_message, client_code)
 
+        # Control endpoints (start, stop, reset, delete...) return no body,
+        # so skip the JSON parse attempt entirely. A 204 is checked first
+        # so its (absent) body is never read. Each caller still gets its
+        # own dict, since callers may add keys to the result.
+        if response.status_code == 204 or response.headers.get('Content-Length') == '0':
+            content = b''
+        else:
+            content = response.content
+        if not content:
+            _info("  Body: (empty)")
+            _info("%s\n", _SEP)
+            return {}
+
+        try:
+            # Parsed straight from the raw bytes, without decoding to str first
+            response_json = _loads(content)
+            if verbose:
+                if len(content) <= _LOG_BODY_LIMIT:
+                    _info("  Body: %s", _pretty(response_json))
+                else:
+                    _info("  Body: %d bytes (printed at DEBUG level)", len(content))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("  Body: %s", _pretty(response_json))
+        except ValueError:  # json and orjson decode errors, and non-UTF-8 bytes
+            logger.warning("  Body (raw, not JSON): %s", response.text[:500])
+            response_json = {}
+        _info("%s\n", _SEP)
+
         # Return parsed response
         return response_json
 
-    def _parse_error_response(self, response: requests.Response) -> tuple:
+    def _parse_error_response(self, response) -> tuple:
         """
         Extract error message and client_code from API response.
 
@@ -240,21 +473,152 @@ class VagonAPI:
             Tuple of (error_message, client_code)
         """
         try:
-            error_data = response.json()
-            message = error_data.get('message', error_data.get('error', 'Unknown error'))
+            error_data = _loads(response.content)
+        except ValueError as e:  # json and orjson decode errors both subclass it
+            logger.warning(f"[PARSE ERROR] Could not parse JSON. Status: {response.status_code}, Text: {response.text[:200]}, Error: {str(e)}")
+            error_data = None
+
+        # .get() never raises, so a JSON object needs no further error handling
+        if isinstance(error_data, dict):
+            if 'message' in error_data:
+                message = error_data['message']
+            else:
+                message = error_data.get('error', 'Unknown error')
             client_code = error_data.get('client_code', response.status_code)
             logger.info(f"[PARSE ERROR] Parsed JSON error: message={message}, client_code={client_code}")
             return message, client_code
-        except json.JSONDecodeError as e:
-            logger.warning(f"[PARSE ERROR] Could not parse JSON. Status: {response.status_code}, Text: {response.text[:200]}, Error: {str(e)}")
-            # Try to extract meaningful error message from text
-            error_text = response.text.strip() if response.text else ""
-            if not error_text:
-                error_text = f"HTTP {response.status_code} - No response body"
-            return error_text, response.status_code
-        except KeyError as e:
-            logger.warning(f"[PARSE ERROR] Missing key in error response: {str(e)}, Response: {response.text[:200]}")
-            return response.text or f"HTTP {response.status_code}", response.status_code
+
+        # Try to extract meaningful error message from text
+        error_text = response.text.strip() if response.text else ""
+        if not error_text:
+            error_text = f"HTTP {response.status_code} - No response body"
+        return error_text, response.status_code
+
+    # =========================================================================
+    # RESPONSE CACHE
+    # =========================================================================
+
+    @staticmethod
+    def _cache_key(path: str, params: Optional[Dict] = None) -> tuple:
+        """Build a hashable cache key from a request path and query params."""
+        return (path, tuple(sorted(params.items())) if params else ())
+
+    def _cache_lookup(self, key: tuple) -> tuple:
+        """
+        Look up a cached response.
+
+        Returns:
+            Tuple of (response, needs_refresh). The response is None when
+            missing or past its stale window.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None, True
+        try:
+            self._cache.move_to_end(key)
+        except KeyError:  # Evicted by another thread in the meantime
+            pass
+        fresh_until, stale_until, body, _ = entry
+        now = time.monotonic()
+        if now < fresh_until:
+            return self._parse_cached(body), False
+        if now < stale_until:
+            return self._parse_cached(body), True
+        return None, True
+
+    @staticmethod
+    def _parse_cached(body: bytes) -> Dict[str, Any]:
+        """
+        Parse a cached response body, as _handle_response() parsed it.
+
+        Cached responses are kept as bytes so that every caller gets its own
+        dict and may modify it (e.g. flatten it in place); parsing is far
+        cheaper than copying the parsed structure.
+        """
+        if not body:
+            return {}
+        try:
+            return _loads(body)
+        except ValueError:
+            return {}
+
+    def _cache_store(
+        self,
+        key: tuple,
+        policy: tuple,
+        body: bytes,
+        validators: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Cache a raw response body according to a (fresh_for, stale_for) policy."""
+        now = time.monotonic()
+        fresh_for, stale_for = policy
+        cache = self._cache
+        cache[key] = (now + fresh_for, now + stale_for, body, validators)
+        cache.move_to_end(key)
+        while len(cache) > self.CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _validators(response) -> Optional[Dict[str, str]]:
+        """Conditional request headers for revalidating a response, if any."""
+        validators = {}
+        etag = response.headers.get('ETag')
+        if etag:
+            validators['If-None-Match'] = etag
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified:
+            validators['If-Modified-Since'] = last_modified
+        return validators or None
+
+    def _store_response(
+        self,
+        key: tuple,
+        policy: tuple,
+        response,
+        entry: Optional[tuple],
+        generation: int
+    ) -> Dict[str, Any]:
+        """Cache the outcome of _fetch() and return the response body."""
+        if response.status_code == 304 and entry is not None:
+            logger.info("[VAGON API CACHE] Not modified: %s", key[0])
+            body, validators = entry[2], entry[3]
+            value = self._parse_cached(body)
+        else:
+            value = self._handle_response(response)
+            body, validators = response.content, self._validators(response)
+        # Skip the store if the cache was invalidated meanwhile, or if the
+        # entry could never be served: revalidate-only tiers need validators
+        if generation == self._cache_generation and (validators is not None or policy[1]):
+            self._cache_store(key, policy, body, validators)
+        return value
+
+    def _claim_refresh(self, key: tuple) -> bool:
+        """Mark key as refreshing; False if a refresh is already running."""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def invalidate_cache(self, prefix: Optional[str] = None) -> None:
+        """
+        Drop cached responses.
+
+        Called automatically by methods that modify cached resources.
+
+        Args:
+            prefix: Only drop responses whose path starts with this prefix
+                (optional, drops everything by default)
+
+        Example:
+            >>> client.invalidate_cache(client.IMAGES_PATH)
+        """
+        self._cache_generation += 1
+        if prefix is None:
+            self._cache.clear()
+            return
+        for key in [key for key in list(self._cache) if key[0].startswith(prefix)]:
+            self._cache.pop(key, None)
 
     # =========================================================================
     # MACHINES ENDPOINTS (formerly SEATS)
@@ -309,7 +673,41 @@ class VagonAPI:
         if status:
             params["status"] = status
 
-        return self._request("GET", "/organization-management/v1/machines", params=params)
+        return self._request("GET", self.MACHINES_PATH, params=params)
+
+    def iter_machines(
+        self,
+        per_page: int = 100,
+        query: Optional[str] = None,
+        time_left: Optional[int] = None,
+        has_session_data: Optional[bool] = None,
+        status: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all machines, one flattened machine at a time.
+
+        Walks every page of list_machines(), fetching the next page while
+        the current one is consumed. Filters are the same as list_machines().
+
+        Args:
+            per_page: Number of machines fetched per request (default: 100)
+
+        Yields:
+            Flattened machine dicts
+
+        Example:
+            >>> for machine in client.iter_machines(status='running'):
+            ...     client.stop_machine(machine['id'])
+        """
+        return self._iter_pages(
+            self.list_machines,
+            'machines',
+            per_page=per_page,
+            query=query,
+            time_left=time_left,
+            has_session_data=has_session_data,
+            status=status
+        )
 
     # Backward compatibility alias (deprecated)
     def list_seats(self, *args, **kwargs) -> Dict[str, Any]:
@@ -318,15 +716,20 @@ class VagonAPI:
         """
         return self.list_machines(*args, **kwargs)
 
-    def get_seat(self, seat_id: int) -> Dict[str, Any]:
+    def get_seat(self, seat_id: int, cache: bool = True) -> Dict[str, Any]:
         """
         Get detailed information about a specific seat.
 
         Note: This endpoint is kept for backward compatibility.
         Consider using get_machine() instead.
 
+        Responses are revalidated using the CACHE_REVALIDATE tier. Every call
+        returns its own dict, which the caller may modify.
+
         Args:
             seat_id: The unique identifier of the seat
+            cache: Reuse the cached response when the API reports it
+                unchanged (default: True)
 
         Returns:
             Seat object containing:
@@ -343,7 +746,11 @@ class VagonAPI:
             >>> print(f"Seat: {seat['name']}")
             >>> print(f"User: {seat['user']['email']}")
         """
-        return self._request("GET", f"/organization-management/v1/seats/{seat_id}")
+        return self._cached_get(
+            f"/organization-management/v1/seats/{seat_id}",
+            policy=self.CACHE_REVALIDATE,
+            cache=cache
+        )
 
     def list_machine_content(self, machine_id: int, path: str) -> Dict[str, Any]:
         """
@@ -411,6 +818,37 @@ class VagonAPI:
             params=params
         )
 
+    def iter_machine_files(
+        self,
+        machine_id: int,
+        parent_id: int = 0,
+        per_page: int = 100,
+        query: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all files in a machine's directory, one at a time.
+
+        Walks every page of get_machine_files(), fetching the next page
+        while the current one is consumed.
+
+        Args:
+            machine_id: The machine ID
+            parent_id: Parent directory ID (0 for root)
+            per_page: Number of items fetched per request (default: 100)
+            query: Search query to filter files
+
+        Yields:
+            Flattened file/directory dicts
+        """
+        return self._iter_pages(
+            self.get_machine_files,
+            'files',
+            machine_id=machine_id,
+            parent_id=parent_id,
+            per_page=per_page,
+            query=query
+        )
+
     # Backward compatibility aliases (deprecated)
     def list_seat_content(self, seat_id: int, path: str) -> Dict[str, Any]:
         """
@@ -437,12 +875,17 @@ class VagonAPI:
     # MACHINE MANAGEMENT ENDPOINTS
     # =========================================================================
 
-    def get_machine(self, machine_id: int) -> Dict[str, Any]:
+    def get_machine(self, machine_id: int, cache: bool = True) -> Dict[str, Any]:
         """
         Get detailed information about a specific machine.
 
+        Responses are revalidated using the CACHE_REVALIDATE tier. Every call
+        returns its own dict, which the caller may modify.
+
         Args:
             machine_id: The unique identifier of the machine
+            cache: Reuse the cached response when the API reports it
+                unchanged (default: True)
 
         Returns:
             Machine object containing:
@@ -457,7 +900,24 @@ class VagonAPI:
             >>> machine = client.get_machine(456)
             >>> print(f"Machine {machine['name']} is {machine['status']}")
         """
-        return self._request("GET", f"/organization-management/v1/machines/{machine_id}")
+        return self._cached_get(
+            f"/organization-management/v1/machines/{machine_id}",
+            policy=self.CACHE_REVALIDATE,
+            cache=cache
+        )
+
+    def get_machines_bulk(self, machine_ids: List[int], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Get details for several machines concurrently.
+
+        Args:
+            machine_ids: List of machine IDs
+            max_concurrency: Maximum requests in flight at once (default: 8)
+
+        Returns:
+            List of machine objects in the same order as machine_ids
+        """
+        return self._parallel(self.get_machine, machine_ids, max_concurrency)
 
     def start_machine(
         self,
@@ -603,15 +1063,46 @@ class VagonAPI:
             >>> for mt in machine_types:
             ...     print(f"{mt['name']} - {mt['friendly_name']}")
         """
-        result = self._request(
-            "GET",
-            f"/organization-management/v1/machines/{machine_id}/available-machine-types"
+        return self._then(
+            self._request(
+                "GET",
+                f"/organization-management/v1/machines/{machine_id}/available-machine-types"
+            ),
+            self._machine_types_from
         )
+
+    @staticmethod
+    def _machine_types_from(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Flattened machine types of an available-machine-types response."""
         # API returns machine types wrapped in a "machine_types" key
-        machine_types = result.get("machine_types", [])
-        if isinstance(machine_types, list):
-            return [flatten_jsonapi_resource(item) for item in machine_types]
-        return []
+        machine_types = result.get("machine_types")
+        if not isinstance(machine_types, list):
+            return []
+        # The response is never cached, so it can be flattened in place
+        return flatten_jsonapi_list(machine_types, inplace=True)
+
+    def get_available_machine_types_bulk(
+        self,
+        machine_ids: List[int],
+        max_concurrency: int = 8
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Get available machine types for several machines concurrently.
+
+        Args:
+            machine_ids: List of machine IDs
+            max_concurrency: Maximum requests in flight at once (default: 8)
+
+        Returns:
+            One list of flattened machine types per machine, in the same
+            order as machine_ids
+
+        Example:
+            >>> ids = [m['id'] for m in client.list_machines()['machines']]
+            >>> for machine_id, types in zip(ids, client.get_available_machine_types_bulk(ids)):
+            ...     print(machine_id, [mt['name'] for mt in types])
+        """
+        return self._parallel(self.get_machine_available_machine_types, machine_ids, max_concurrency)
 
     # Backward compatibility alias (deprecated)
     def get_seat_available_machine_types(self, seat_id: int) -> List[Dict[str, Any]]:
@@ -689,7 +1180,35 @@ class VagonAPI:
         if query:
             params["q"] = query
 
-        return self._request("GET", "/organization-management/v1/files", params=params)
+        return self._request("GET", self.FILES_PATH, params=params)
+
+    def iter_files(
+        self,
+        parent_id: int = 0,
+        per_page: int = 100,
+        query: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all shared files in a directory, one at a time.
+
+        Walks every page of list_files(), fetching the next page while the
+        current one is consumed.
+
+        Args:
+            parent_id: Parent directory ID (0 for root)
+            per_page: Number of items fetched per request (default: 100)
+            query: Search query to filter files
+
+        Yields:
+            Flattened file/directory dicts
+        """
+        return self._iter_pages(
+            self.list_files,
+            'files',
+            parent_id=parent_id,
+            per_page=per_page,
+            query=query
+        )
 
     def create_directory(
         self,
@@ -722,7 +1241,7 @@ class VagonAPI:
         if machine_id is not None:
             body["machine_id"] = machine_id
 
-        return self._request("POST", "/organization-management/v1/files", body=body)
+        return self._request("POST", self.FILES_PATH, body=body)
 
     def create_file(
         self,
@@ -779,7 +1298,7 @@ class VagonAPI:
         if machine_id is not None:
             body["machine_id"] = machine_id
 
-        return self._request("POST", "/organization-management/v1/files", body=body)
+        return self._request("POST", self.FILES_PATH, body=body)
 
     def complete_upload(
         self,
@@ -855,12 +1374,17 @@ class VagonAPI:
         """
         return self._request("DELETE", f"/organization-management/v1/files/{file_id}")
 
-    def get_capacity(self, machine_id: Optional[int] = None) -> Dict[str, Any]:
+    def get_capacity(self, machine_id: Optional[int] = None, cache: bool = True) -> Dict[str, Any]:
         """
         Get storage capacity information.
 
+        Responses are revalidated using the CACHE_REVALIDATE tier. Every call
+        returns its own dict, which the caller may modify.
+
         Args:
             machine_id: Machine ID for machine-specific capacity (optional)
+            cache: Reuse the cached response when the API reports it
+                unchanged (default: True)
 
         Returns:
             Dict containing:
@@ -878,10 +1402,11 @@ class VagonAPI:
         if machine_id is not None:
             params["machine_id"] = machine_id
 
-        return self._request(
-            "GET",
+        return self._cached_get(
             "/organization-management/v1/files/capacity",
-            params=params if params else None
+            params=params if params else None,
+            policy=self.CACHE_REVALIDATE,
+            cache=cache
         )
 
     # =========================================================================
@@ -894,17 +1419,21 @@ class VagonAPI:
         end_date: str,
         action_type: Optional[str] = None,
         user_email: Optional[str] = None,
-        organization_machine_id: Optional[int] = None
+        organization_machine_id: Optional[int] = None,
+        cache: bool = True
     ) -> Dict[str, Any]:
         """
         Fetch recent user action logs (last 30 days) with optional filters.
 
+        Responses are cached using the CACHE_SHORT tier.
+
         Args:
             start_date: ISO-8601 start datetime (inclusive)
             end_date: ISO-8601 end datetime (inclusive)
             action_type: Optional action type filter
             user_email: Optional user email filter
             organization_machine_id: Optional machine ID filter
+            cache: Serve a recently cached response if available (default: True)
 
         Returns:
             Dict containing:
@@ -924,16 +1453,22 @@ class VagonAPI:
         if organization_machine_id is not None:
             params["organization_machine_id"] = organization_machine_id
 
-        return self._request(
-            "GET",
-            "/organization-management/v1/user-action-logs",
-            params=params
+        return self._cached_get(
+            self.USER_ACTION_LOGS_PATH,
+            params=params,
+            policy=self.CACHE_SHORT,
+            cache=cache
         )
 
-    def list_softwares(self) -> Dict[str, Any]:
+    def list_softwares(self, cache: bool = True) -> Dict[str, Any]:
         """
         List all available softwares and base images.
 
+        Responses are cached using the CACHE_LONG tier.
+
+        Args:
+            cache: Serve a recently cached response if available (default: True)
+
         Returns:
             Dict containing:
                 - software: List of software objects (id, name, size)
@@ -946,7 +1481,11 @@ class VagonAPI:
             >>> for base_image in result['base_images']:
             ...     print(f"{base_image['name']}: {base_image['size']} GB, type: {base_image['type']}")
         """
-        return self._request("GET", "/organization-management/v1/software")
+        return self._cached_get(
+            self.SOFTWARE_PATH,
+            policy=self.CACHE_LONG,
+            cache=cache
+        )
 
     def create_machine(
         self,
@@ -1002,7 +1541,13 @@ class VagonAPI:
         if permissions:
             data["permissions"] = permissions
 
-        return self._request("POST", "/organization-management/v1/machines", body=data)
+        # Pre-installed software creates a new image
+        return self._request(
+            "POST",
+            self.MACHINES_PATH,
+            body=data,
+            invalidate=self.IMAGES_PATH
+        )
 
     # Backward compatibility alias (deprecated)
     def create_seat(
@@ -1024,10 +1569,15 @@ class VagonAPI:
             permissions=permissions
         )
 
-    def get_permission_fields(self) -> Dict[str, Any]:
+    def get_permission_fields(self, cache: bool = True) -> Dict[str, Any]:
         """
         Get all available permission fields with their types and default values.
 
+        Responses are cached using the CACHE_LONG tier.
+
+        Args:
+            cache: Serve a recently cached response if available (default: True)
+
         Returns:
             Dict containing:
                 - permission_fields: List of permission field objects with name, type, and default
@@ -1037,7 +1587,11 @@ class VagonAPI:
             >>> for field in result['permission_fields']:
             ...     print(f"{field['name']}: {field['default']}")
         """
-        return self._request("GET", "/organization-management/v1/machines/permission-fields")
+        return self._cached_get(
+            self.PERMISSION_FIELDS_PATH,
+            policy=self.CACHE_LONG,
+            cache=cache
+        )
 
     def update_machine_permissions(
         self,
@@ -1096,16 +1650,10 @@ class VagonAPI:
                 - download_urls: List of download URL info
                 - count: Number of URLs
         """
-        params = {
-            "start_date": start_date,
-            "end_date": end_date,
-            "expires_in": expires_in
-        }
-
         return self._request(
             "GET",
-            "/organization-management/v1/user-action-logs/archived-download-urls",
-            params=params
+            self.ARCHIVED_LOGS_PATH,
+            params=_archive_logs_query(start_date, end_date, expires_in)
         )
 
     # =========================================================================
@@ -1116,18 +1664,21 @@ class VagonAPI:
         self,
         page: int = 1,
         per_page: int = 20,
-        query: Optional[str] = None
+        query: Optional[str] = None,
+        cache: bool = True
     ) -> Dict[str, Any]:
         """
         List all images (templates) in the organization.
 
         Images represent templates that can be assigned to machines.
         Each image can be created from a machine or from pre-installation.
+        Responses are cached using the CACHE_SHORT tier.
 
         Args:
             page: Page number for pagination (default: 1)
             per_page: Number of items per page (default: 20)
             query: Search query to filter images by name (optional)
+            cache: Serve a recently cached response if available (default: True)
 
         Returns:
             Dict containing:
@@ -1145,14 +1696,43 @@ class VagonAPI:
         if query:
             params["q"] = query
 
-        return self._request("GET", "/organization-management/v1/images", params=params)
+        return self._cached_get(
+            self.IMAGES_PATH,
+            params=params,
+            policy=self.CACHE_SHORT,
+            cache=cache
+        )
+
+    def iter_images(self, per_page: int = 100, query: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all images, one flattened image at a time.
 
-    def get_image(self, image_id: int) -> Dict[str, Any]:
+        Pages are fetched one ahead of iteration, so only about two pages
+        are held in memory however many images the organization has. Pages
+        bypass the response cache.
+
+        Args:
+            per_page: Number of images fetched per request (default: 100)
+            query: Search query to filter images by name (optional)
+
+        Yields:
+            Flattened image dicts
+
+        Example:
+            >>> for image in client.iter_images():
+            ...     print(f"{image['name']}: {image['status']}")
+        """
+        return self._iter_pages(self.list_images, 'images', per_page=per_page, query=query, cache=False)
+
+    def get_image(self, image_id: int, cache: bool = True) -> Dict[str, Any]:
         """
         Get detailed information about a specific image.
 
+        Responses are cached using the CACHE_SHORT tier.
+
         Args:
             image_id: The unique identifier of the image
+            cache: Serve a recently cached response if available (default: True)
 
         Returns:
             Image object containing:
@@ -1169,7 +1749,28 @@ class VagonAPI:
             >>> image = client.get_image(123)
             >>> print(f"Image {image['name']} is {image['status']}")
         """
-        return self._request("GET", f"/organization-management/v1/images/{image_id}")
+        return self._cached_get(
+            f"{self.IMAGES_PATH}/{image_id}",
+            policy=self.CACHE_SHORT,
+            cache=cache
+        )
+
+    def get_images_bulk(self, image_ids: List[int], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Get details for several images concurrently.
+
+        Args:
+            image_ids: List of image IDs
+            max_concurrency: Maximum requests in flight at once (default: 8)
+
+        Returns:
+            List of image objects in the same order as image_ids
+
+        Example:
+            >>> images = client.list_images()
+            >>> details = client.get_images_bulk([i['id'] for i in images['images']])
+        """
+        return self._parallel(self.get_image, image_ids, max_concurrency)
 
     def install_image(
         self,
@@ -1211,8 +1812,9 @@ class VagonAPI:
 
         return self._request(
             "POST",
-            "/organization-management/v1/images/install",
-            body=body if body else None
+            f"{self.IMAGES_PATH}/install",
+            body=body if body else None,
+            invalidate=self.IMAGES_PATH
         )
 
     def create_image(
@@ -1251,8 +1853,9 @@ class VagonAPI:
 
         return self._request(
             "POST",
-            "/organization-management/v1/images",
-            body=body
+            self.IMAGES_PATH,
+            body=body,
+            invalidate=self.IMAGES_PATH
         )
 
     def assign_image(
@@ -1288,8 +1891,9 @@ class VagonAPI:
         """
         return self._request(
             "POST",
-            f"/organization-management/v1/images/{image_id}/assign",
-            body={"machine_ids": machine_ids}
+            f"{self.IMAGES_PATH}/{image_id}/assign",
+            body={"machine_ids": machine_ids},
+            invalidate=self.IMAGES_PATH
         )
 
     def delete_image(self, image_id: int) -> Dict[str, Any]:
@@ -1310,13 +1914,569 @@ class VagonAPI:
         Example:
             >>> client.delete_image(123)
         """
-        return self._request("DELETE", f"/organization-management/v1/images/{image_id}")
+        return self._request(
+            "DELETE",
+            f"{self.IMAGES_PATH}/{image_id}",
+            invalidate=self.IMAGES_PATH
+        )
+
+
+# =============================================================================
+# SYNC CLIENT
+# =============================================================================
+
+class VagonAPI(_VagonAPIBase):
+    """
+    Python client for Vagon Computer Management API.
+
+    This client handles HMAC authentication and provides methods for all
+        available API endpoints including machines and files management.
+
+    Attributes:
+        api_key: Your Vagon API key
+        api_secret: Your Vagon API secret
+        base_url: API base URL (default: production)
+
+    Example:
+        >>> client = VagonAPI("api_key", "api_secret")
+        >>> machines = client.list_machines()
+        >>> print(f"Found {machines['count']} machines")
+    """
+
+    def _connect(self) -> None:
+        """Create the requests session used by _send."""
+        # A persistent session keeps connections alive between calls, so
+        # only the first request to the API pays for the TCP/TLS handshake.
+        # Connection errors are retried by urllib3 below requests. Status
+        # retries are handled in _request, since every attempt needs a new
+        # HMAC timestamp and nonce.
+        self._session = requests.Session()
+        # Responses are compressed on the wire: requests advertises
+        # "gzip, deflate" by default, plus "br" when brotli is installed,
+        # so only encodings it can decode are ever negotiated
+        self._session.headers.update({"Accept": "application/json"})
+        retry = Retry(
+            total=self.max_retries,
+            read=False,
+            redirect=False,
+            status=0,
+            backoff_factor=self.backoff_factor,
+            respect_retry_after_header=False
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=50)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Stale cache entries are refreshed by a few shared threads, so a
+        # bulk read over many stale keys can't flood the connection pool
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=self.REFRESH_WORKERS,
+            thread_name_prefix="vagon-cache-refresh"
+        )
+
+    def __enter__(self) -> "VagonAPI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connections and stop background refreshes."""
+        self._refresh_executor.shutdown(wait=False)
+        self._session.close()
+
+    # =========================================================================
+    # HTTP TRANSPORT
+    # =========================================================================
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Union[Dict, str]] = None,
+        body: Optional[Dict] = None,
+        invalidate: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Make an authenticated HTTP request to the Vagon API.
+
+        Args:
+            method: HTTP method (GET, POST, DELETE)
+            path: API endpoint path
+            params: Query parameters as a dict or pre-encoded string (optional)
+            body: Request body as dict (optional)
+            invalidate: Path prefix of cached responses to drop once the
+                request succeeds (optional)
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            VagonAPIError: If the API returns an error response
+        """
+        result = self._handle_response(self._send(method, path, params, body))
+        if invalidate is not None:
+            self.invalidate_cache(invalidate)
+        return result
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Union[Dict, str]] = None,
+        body: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Send a signed request, retrying retryable status codes.
+
+        Args:
+            method: HTTP method (GET, POST, DELETE)
+            path: API endpoint path
+            params: Query parameters (optional)
+            body: Request body as dict (optional)
+            headers: Extra request headers (optional)
+
+        Returns:
+            The raw response of the final attempt
+        """
+        # Serialize body once; every attempt signs and sends the same bytes.
+        # Bodiless requests (GETs, DELETEs, control actions) never reach the
+        # encoder, and None or {} both mean no body at all.
+        body_bytes = _dumps(body) if body else b''
+        attempt = 0
+        while True:
+            # Wait for a rate-limit slot before signing, so the signature's
+            # timestamp is fresh when the request is actually sent
+            if self._rate_limiter is not None:
+                time.sleep(self._rate_limiter.reserve())
+            full_url, request_headers = self._prepare_request(method, path, params, body, body_bytes)
+            if headers:
+                request_headers.update(headers)
+
+            # Make the request
+            response = self._session.request(
+                method=method,
+                url=full_url,
+                headers=request_headers,
+                params=params,
+                data=body_bytes if body_bytes else None,
+                timeout=self.timeout
+            )
+
+            if not self._should_retry(method, response.status_code, attempt):
+                return response
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+            time.sleep(delay)
+            attempt += 1
+
+    def _then(self, result: Any, fn: Callable[[Any], Any]) -> Any:
+        """Post-process a request result; AsyncVagonAPI applies fn once awaited."""
+        return fn(result)
+
+    def _parallel(
+        self,
+        fn: Callable[..., Any],
+        args_list: Iterable[Any],
+        max_workers: int = 8
+    ) -> List[Any]:
+        """
+        Call fn once per item of args_list concurrently, preserving order.
+
+        Calls are I/O bound, so threads overlap network latency while the
+        pooled session hands each thread its own keep-alive connection.
+        The session pool (50 connections) must stay at least max_workers.
+
+        Returns:
+            List of results in the same order as args_list
+        """
+        args_list = list(args_list)
+        if not args_list:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+            return list(executor.map(fn, args_list))
+
+    def _iter_pages(
+        self,
+        fetch: Callable[..., Dict[str, Any]],
+        key: str,
+        **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the flattened items of every page of a paginated listing.
+
+        The next page is requested in the background as soon as the current
+        one arrives, so its round-trip overlaps with the caller consuming
+        the current page. Only about two pages are held in memory.
+
+        Args:
+            fetch: Listing method accepting a page keyword, e.g. list_machines
+            key: Response key holding the page's items, e.g. 'machines'
+            **kwargs: Other arguments passed to fetch on every page
+
+        Yields:
+            Flattened items
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending = None
+        try:
+            pending = executor.submit(fetch, page=1, **kwargs)
+            while pending is not None:
+                result = pending.result()
+                next_page = result.get('next_page')
+                pending = executor.submit(fetch, page=next_page, **kwargs) if next_page else None
+                # Each page is a fresh response, so it is safe to flatten in place
+                for item in result.get(key, []):
+                    yield flatten_jsonapi_resource(item, inplace=True)
+        finally:
+            # Don't block a caller that stopped early on an unused prefetch.
+            # At most one fetch is pending, so cancelling it directly does
+            # what shutdown(cancel_futures=True) would without needing 3.9+.
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+    # =========================================================================
+    # RESPONSE CACHE
+    # =========================================================================
+
+    def _fetch(self, key: tuple, path: str, params: Optional[Dict], policy: tuple) -> Dict[str, Any]:
+        """
+        GET a cacheable response and store it.
+
+        An existing entry, even an expired one, is revalidated with its
+        ETag / Last-Modified, so an unchanged resource costs a bodiless
+        304 instead of a full download and parse.
+        """
+        entry = self._cache.get(key)
+        generation = self._cache_generation
+        response = self._send("GET", path, params, headers=entry[3] if entry else None)
+        return self._store_response(key, policy, response, entry, generation)
+
+    def _refresh(self, key: tuple, path: str, params: Optional[Dict], policy: tuple) -> None:
+        """Fetch a fresh response for a stale cache entry."""
+        try:
+            self._fetch(key, path, params, policy)
+        except Exception as e:
+            logger.warning("[VAGON API CACHE] Background refresh of %s failed: %s", path, e)
+        finally:
+            self._refreshing.discard(key)
+
+    def _start_refresh(self, key: tuple, path: str, params: Optional[Dict], policy: tuple) -> None:
+        """Refresh a stale cache entry on the shared refresh executor."""
+        if self._claim_refresh(key):
+            try:
+                self._refresh_executor.submit(self._refresh, key, path, params, policy)
+            except RuntimeError:  # Client closed; keep serving the stale entry
+                self._refreshing.discard(key)
+
+    def _cached_get(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        policy: tuple = _VagonAPIBase.CACHE_NORMAL,
+        cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        GET request served from the response cache.
+
+        Fresh responses are returned directly. Stale responses are returned
+        immediately while a background refresh fetches a new one
+        (stale-while-revalidate). Only missing or expired entries block on
+        the API, and expired entries are revalidated with a conditional GET.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters (optional)
+            policy: Cache tier, one of CACHE_SHORT, CACHE_NORMAL, CACHE_LONG,
+                CACHE_REVALIDATE
+            cache: Set to False to bypass the cache for this call
+
+        Returns:
+            Parsed JSON response, a new dict on every call (hits included)
+        """
+        if not cache:
+            return self._request("GET", path, params=params)
+
+        key = self._cache_key(path, params)
+        value, needs_refresh = self._cache_lookup(key)
+        if value is None:
+            value = self._fetch(key, path, params, policy)
+        elif needs_refresh:
+            self._start_refresh(key, path, params, policy)
+        return value
 
 
+# =============================================================================
+# ASYNC CLIENT
+# =============================================================================
+
+class AsyncVagonAPI(_VagonAPIBase):
+    """
+    Asynchronous client for Vagon Computer Management API.
+
+    Provides the same endpoint methods as VagonAPI (both inherit them from
+    _VagonAPIBase), each returning an awaitable, so independent calls can be issued concurrently with asyncio.gather().
+    Requests share a single httpx.AsyncClient, multiplexed over HTTP/2
+    when the h2 package is installed.
+
+    Requires the optional httpx dependency: pip install "httpx[http2]"
+
+    Example:
+        >>> async with AsyncVagonAPI("api_key", "api_secret") as client:
+        ...     machines = await client.list_machines()
+        ...     ids = [m['id'] for m in machines['machines']]
+        ...     types = await asyncio.gather(
+        ...         *(client.get_machine_available_machine_types(i) for i in ids)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        base_url: str = _VagonAPIBase.PRODUCTION_URL,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+        timeout: Optional[float] = 30,
+        rate_limit: Optional[float] = None
+    ):
+        """
+        Initialize the async Vagon API client.
+
+        Args:
+            api_key: Your API key from organization settings
+            api_secret: Your API secret from organization settings
+            base_url: API base URL (default: production)
+            max_retries: Retries for connection errors and retryable
+                status codes (default: 3)
+            backoff_factor: Base delay in seconds for exponential backoff
+                between retries (default: 0.3)
+            timeout: Request timeout in seconds, None to wait forever (default: 30)
+            rate_limit: Maximum requests per second sent by this client,
+                retries included (optional, unlimited by default)
+        """
+        super().__init__(
+            api_key, api_secret, base_url, max_retries, backoff_factor, timeout, rate_limit
+        )
+        self._refresh_tasks: set = set()
+
+    def _connect(self) -> None:
+        """Create the httpx.AsyncClient used by _send (instead of a requests session)."""
+        try:
+            import httpx
+        except ImportError as exc:
+            raise ImportError(
+                'AsyncVagonAPI requires httpx: pip install "httpx[http2]"'
+            ) from exc
+        # HTTP/2 needs the h2 package from the httpx[http2] extra; plain
+        # httpx installs still work, over pooled HTTP/1.1 connections
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        # The transport retries connection errors; status retries are
+        # re-signed in _request like the sync client.
+        self._client = httpx.AsyncClient(
+            headers={"Accept": "application/json"},
+            timeout=self.timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=http2,
+                retries=self.max_retries,
+                # Room for hundreds of in-flight requests; idle connections
+                # stay open for a minute between bursts of polling
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60
+                )
+            )
+        )
+
+    async def __aenter__(self) -> "AsyncVagonAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Union[Dict, str]] = None,
+        body: Optional[Dict] = None,
+        invalidate: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Make an authenticated HTTP request to the Vagon API.
+
+        Async counterpart of VagonAPI._request().
+        """
+        result = self._handle_response(await self._send(method, path, params, body))
+        if invalidate is not None:
+            self.invalidate_cache(invalidate)
+        return result
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Union[Dict, str]] = None,
+        body: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Send a signed request, retrying retryable status codes.
+
+        Async counterpart of VagonAPI._send().
+        """
+        # Serialize body once; every attempt signs and sends the same bytes.
+        # Bodiless requests (GETs, DELETEs, control actions) never reach the
+        # encoder, and None or {} both mean no body at all.
+        body_bytes = _dumps(body) if body else b''
+        attempt = 0
+        while True:
+            # Wait for a rate-limit slot before signing, so the signature's
+            # timestamp is fresh when the request is actually sent
+            if self._rate_limiter is not None:
+                await asyncio.sleep(self._rate_limiter.reserve())
+            full_url, request_headers = self._prepare_request(method, path, params, body, body_bytes)
+            if headers:
+                request_headers.update(headers)
+
+            response = await self._client.request(
+                method,
+                full_url,
+                headers=request_headers,
+                params=params,
+                content=body_bytes if body_bytes else None
+            )
+
+            if not self._should_retry(method, response.status_code, attempt):
+                return response
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _then(self, awaitable: Any, fn: Callable[[Any], Any]) -> Any:
+        """Post-process a request result once it has been awaited."""
+        return fn(await awaitable)
+
+    async def _cached_get(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        policy: tuple = _VagonAPIBase.CACHE_NORMAL,
+        cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        GET request served from the response cache.
+
+        Async counterpart of VagonAPI._cached_get().
+        """
+        if not cache:
+            return await self._request("GET", path, params=params)
+
+        key = self._cache_key(path, params)
+        value, needs_refresh = self._cache_lookup(key)
+        if value is None:
+            value = await self._fetch(key, path, params, policy)
+        elif needs_refresh:
+            self._start_refresh(key, path, params, policy)
+        return value
+
+    async def _fetch(self, key: tuple, path: str, params: Optional[Dict], policy: tuple) -> Dict[str, Any]:
+        """
+        GET a cacheable response and store it.
+
+        Async counterpart of VagonAPI._fetch().
+        """
+        entry = self._cache.get(key)
+        generation = self._cache_generation
+        response = await self._send("GET", path, params, headers=entry[3] if entry else None)
+        return self._store_response(key, policy, response, entry, generation)
+
+    async def _refresh(self, key: tuple, path: str, params: Optional[Dict], policy: tuple) -> None:
+        """Fetch a fresh response for a stale cache entry."""
+        try:
+            await self._fetch(key, path, params, policy)
+        except Exception as e:
+            logger.warning("[VAGON API CACHE] Background refresh of %s failed: %s", path, e)
+        finally:
+            self._refreshing.discard(key)
+
+    def _start_refresh(self, key: tuple, path: str, params: Optional[Dict], policy: tuple) -> None:
+        """Refresh a stale cache entry in a background task."""
+        if self._claim_refresh(key):
+            task = asyncio.get_running_loop().create_task(self._refresh(key, path, params, policy))
+            # Keep a reference so the task is not garbage collected mid-flight
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _iter_pages(
+        self,
+        fetch: Callable[..., Any],
+        key: str,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the flattened items of every page of a paginated listing.
+
+        Async counterpart of VagonAPI._iter_pages(), so the inherited
+        iter_* methods return async iterators for use with ``async for``.
+        """
+        pending = asyncio.ensure_future(fetch(page=1, **kwargs))
+        try:
+            while pending is not None:
+                result = await pending
+                next_page = result.get('next_page')
+                pending = asyncio.ensure_future(fetch(page=next_page, **kwargs)) if next_page else None
+                for item in result.get(key, []):
+                    yield flatten_jsonapi_resource(item, inplace=True)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _parallel(
+        self,
+        fn: Callable[..., Any],
+        args_list: Iterable[Any],
+        max_workers: int = 8
+    ) -> List[Any]:
+        """
+        Await fn once per item of args_list concurrently, preserving order.
+
+        An asyncio.Semaphore keeps at most max_workers requests in flight,
+        which is how the *_bulk methods' max_concurrency is enforced.
+
+        Returns:
+            List of results in the same order as args_list
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(arg):
+            async with semaphore:
+                return await fn(arg)
+
+        return list(await asyncio.gather(*(run(arg) for arg in args_list)))
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+# format_bytes units, each 1024 times the previous one
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_bytes(size: int) -> str:
     """
     Format bytes to human-readable string.
@@ -1327,14 +2487,16 @@ def format_bytes(size: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 GB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024:
-            return f"{size:.2f} {unit}"
-        size /= 1024
-    return f"{size:.2f} PB"
+    if size < 1024:
+        return f"{size:.2f} B"
+    # Each unit is 2**10 larger, so the bit length picks the unit directly.
+    # Int sizes stay in integer arithmetic until the single final division.
+    bits = (size if type(size) is int else int(size)).bit_length() - 1
+    index = bits // 10 if bits < 60 else 5
+    return f"{size / (1 << (index * 10)):.2f} {_UNITS[index]}"
 
 
-def flatten_jsonapi_resource(resource: Dict[str, Any]) -> Dict[str, Any]:
+def flatten_jsonapi_resource(resource: Dict[str, Any], inplace: bool = False) -> Dict[str, Any]:
     """
     Flatten a JSON:API resource into a simple dict.
 
@@ -1360,6 +2522,12 @@ def flatten_jsonapi_resource(resource: Dict[str, Any]) -> Dict[str, Any]:
 
     Args:
         resource: JSON:API resource object
+        inplace: Flatten ``resource`` itself (and its nested resources)
+            instead of building new dicts. The result equals the copied
+            one; other keys such as ``relationships`` or ``links`` are
+            dropped. Only pass True when nothing else needs the original
+            resource; every response returned by the client, cached or
+            not, is a dict of the caller's own.
 
     Returns:
         Flattened dict with id, type, and all attributes at top level
@@ -1367,40 +2535,296 @@ def flatten_jsonapi_resource(resource: Dict[str, Any]) -> Dict[str, Any]:
     if not resource:
         return {}
 
-    result = {
-        'id': resource.get('id'),
-        'type': resource.get('type')
-    }
-
-    # Flatten attributes
-    attributes = resource.get('attributes', {})
-    if attributes:
-        result.update(attributes)
-
-        # Recursively flatten nested resources (user, machine)
-        for key in ['user', 'machine']:
-            if key in result and isinstance(result[key], dict) and 'attributes' in result[key]:
-                result[key] = flatten_jsonapi_resource(result[key])
-        
+    # Attributes are read once and merged straight into the result; the
+    # nested-resource pass only runs when one of its keys is present.
+    if inplace:
+        attributes = _take_attributes(resource)
+        if not attributes:
+            return resource
+        resource.update(attributes)
+        result = resource
+    else:
+        attributes = resource.get('attributes')
+        if not attributes:
+            return {'id': resource.get('id'), 'type': resource.get('type')}
+        result = {'id': resource.get('id'), 'type': resource.get('type'), **attributes}
+
+    if 'user' in result or 'machine' in result or 'softwares' in result:
+        _flatten_nested(result, inplace)
+    return result
+
+
+def _flatten_nested(out: Dict[str, Any], inplace: bool) -> None:
+    """
+    Flatten the nested resources (user, machine, softwares) of a resource
+    whose attributes are already merged into ``out``.
+
+    Uses an explicit work stack of (output dict, source resource) pairs
+    instead of recursive calls.
+    """
+    stack = []
+    push = stack.append
+    while True:
+        # Flatten nested resources (user, machine). Unrolled, since
+        # every resource pays for both checks.
+        nested = out.get('user')
+        if type(nested) is dict and 'attributes' in nested:
+            push(_nested_entry(out, 'user', nested, inplace))
+        nested = out.get('machine')
+        if type(nested) is dict and 'attributes' in nested:
+            push(_nested_entry(out, 'machine', nested, inplace))
+
         # Handle nested softwares attribute (JSON:API format with data array)
-        if 'softwares' in result and isinstance(result['softwares'], dict):
-            softwares_data = result['softwares'].get('data', [])
-            if isinstance(softwares_data, list):
-                result['softwares'] = flatten_jsonapi_list(softwares_data)
-            else:
-                result['softwares'] = []
+        softwares = out.get('softwares')
+        if type(softwares) is dict:
+            softwares_data = softwares.get('data', [])
+            flattened = []
+            if type(softwares_data) is list:
+                for item in softwares_data:
+                    if item:
+                        flat = item if inplace else {'id': item.get('id'), 'type': item.get('type')}
+                        push((flat, item))
+                    else:
+                        flat = {}
+                    flattened.append(flat)
+            out['softwares'] = flattened
+
+        # Merge the next queued resource that has attributes
+        attributes = None
+        while not attributes:
+            if not stack:
+                return
+            out, source = stack.pop()
+            attributes = _take_attributes(source) if inplace else source.get('attributes')
+        out.update(attributes)
+
+
+def _take_attributes(resource: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Reduce ``resource`` to its id and type, in that order, and return its
+    attributes, so in-place flattening matches the copied output.
+    """
+    attributes = resource.get('attributes')
+    id_, type_ = resource.get('id'), resource.get('type')
+    resource.clear()
+    resource['id'] = id_
+    resource['type'] = type_
+    return attributes
 
-    return result
 
+def _nested_entry(out: Dict[str, Any], key: str, nested: Dict[str, Any], inplace: bool) -> tuple:
+    """Work-stack entry for flattening the nested resource out[key]."""
+    if inplace:
+        return nested, nested
+    flat = out[key] = {'id': nested.get('id'), 'type': nested.get('type')}
+    return flat, nested
 
-def flatten_jsonapi_list(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+def flatten_jsonapi_list(items: List[Dict[str, Any]], inplace: bool = False) -> List[Dict[str, Any]]:
     """
     Flatten a list of JSON:API resources.
 
     Args:
-        items: List of JSON:API resource objects
+        items: List of JSON:API resource objects (None is treated as empty)
+        inplace: Flatten each item in place (see flatten_jsonapi_resource)
 
     Returns:
         List of flattened dicts
+
+    For large lists that are consumed once (exports, bulk inserts), prefer
+    iflatten_jsonapi_list to avoid holding a second full list in memory.
+    """
+    if not items:
+        return []
+    flatten = flatten_jsonapi_resource
+    return [flatten(item, inplace) for item in items]
+
+
+def iflatten_jsonapi_list(items: Iterable[Dict[str, Any]], inplace: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily flatten JSON:API resources, yielding one dict at a time.
+
+    Args:
+        items: Iterable of JSON:API resource objects
+        inplace: Flatten each item in place (see flatten_jsonapi_resource)
+
+    Returns:
+        Iterator of flattened dicts
+
+    Example:
+        >>> for row in iflatten_jsonapi_list(result['data'], inplace=True):
+        ...     writer.writerow(row)
+    """
+    flatten = flatten_jsonapi_resource
+    return (flatten(item, inplace) for item in items or ())
+
+
+def flatten_jsonapi_list_streaming(
+    items: Iterable[Dict[str, Any]],
+    sink: Callable[[Dict[str, Any]], Any]
+) -> None:
+    """
+    Flatten JSON:API resources into a single reused dict, one at a time.
+
+    Each flattened resource is passed to ``sink``, which must consume it
+    (write a CSV row, add a DB insert) before returning: the same dict is
+    cleared and refilled for the next item. Resources with nested
+    user/machine/softwares attributes go through flatten_jsonapi_resource
+    and get a dict of their own.
+
+    Args:
+        items: Iterable of JSON:API resource objects
+        sink: Called with each flattened resource
+
+    Example:
+        >>> flatten_jsonapi_list_streaming(result['data'], writer.writerow)
+    """
+    flatten = flatten_jsonapi_resource
+    buf: Dict[str, Any] = {}
+    clear, update = buf.clear, buf.update
+    for item in items or ():
+        attributes = item.get('attributes') if item else None
+        if not item or (attributes and (
+                'user' in attributes or 'machine' in attributes or 'softwares' in attributes)):
+            sink(flatten(item))
+            continue
+        clear()
+        buf['id'] = item.get('id')
+        buf['type'] = item.get('type')
+        if attributes:
+            update(attributes)
+        sink(buf)
+
+
+def flatten_jsonapi_to_columns(items: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Flatten a list of JSON:API resources into columns (one list per field).
+
+    Builds the columnar layout directly instead of one dict per row, which
+    suits homogeneous listings fed to pandas or exporters. Attribute values
+    are stored as-is; nested resources are not flattened. Rows missing a
+    field hold None in that column.
+
+    Args:
+        items: List of JSON:API resource objects
+
+    Returns:
+        Dict mapping field name to a list of len(items) values
+
+    Example:
+        >>> columns = flatten_jsonapi_to_columns(result['data'])
+        >>> df = pandas.DataFrame(columns)
+    """
+    if not items:
+        return {}
+    count = len(items)
+    first = items[0].get('attributes') or {}
+    columns = {key: [None] * count for key in ('id', 'type', *first)}
+    ids, types = columns['id'], columns['type']
+    for index, item in enumerate(items):
+        ids[index] = item.get('id')
+        types[index] = item.get('type')
+        attributes = item.get('attributes')
+        if attributes:
+            for key, value in attributes.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * count
+                column[index] = value
+    return columns
+
+
+# =============================================================================
+# RESOURCE RECORDS
+# =============================================================================
+
+# dataclass(slots=True) needs Python 3.10+; older versions get the same
+# records as regular dataclasses, with a per-instance dict.
+if sys.version_info >= (3, 10):
+    _record = dataclass(slots=True)
+else:
+    _record = dataclass
+
+
+@_record
+class Image:
+    """
+    Flattened image resource stored in slots instead of a per-instance dict.
+
+    Useful when holding large image listings in memory; attribute access
+    replaces ``image['name']`` lookups.
+    """
+    id: Optional[str] = None
+    type: Optional[str] = None
+    name: Optional[str] = None
+    status: Optional[str] = None
+    size: int = 0
+    source: Any = None
+    created_at: Optional[str] = None
+    softwares: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dict (e.g. for jsonify)."""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@_record
+class Machine:
+    """
+    Flattened machine resource stored in slots instead of a per-instance dict.
+
+    ``user`` holds the nested user as a flattened dict, as produced by
+    flatten_jsonapi_resource.
+    """
+    id: Optional[str] = None
+    type: Optional[str] = None
+    name: Optional[str] = None
+    status: Optional[str] = None
+    friendly_status: Optional[str] = None
+    machine_type: Optional[str] = None
+    machine_type_id: Optional[int] = None
+    remaining_usage: Optional[int] = None
+    disk_size: Optional[int] = None
+    file_storage_size: Optional[int] = None
+    user: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dict (e.g. for jsonify)."""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@_record
+class User:
+    """
+    Flattened user resource stored in slots instead of a per-instance dict.
+    """
+    id: Optional[str] = None
+    type: Optional[str] = None
+    name: Optional[str] = None
+    email: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dict (e.g. for jsonify)."""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+def flatten_to_record(resource: Dict[str, Any], cls: type) -> Any:
+    """
+    Flatten a JSON:API resource into a record class (Image, Machine, User).
+
+    Attributes the record doesn't declare are dropped; missing ones keep
+    the record's defaults.
+
+    Args:
+        resource: JSON:API resource object
+        cls: Dataclass to build
+
+    Returns:
+        Instance of cls
+
+    Example:
+        >>> images = [flatten_to_record(item, Image) for item in result['images']]
+        >>> images[0].name
     """
-    return [flatten_jsonapi_resource(item) for item in items]
+    flat = flatten_jsonapi_resource(resource)
+    return cls(**{name: flat[name] for name in cls.__dataclass_fields__ if name in flat})